@@ -0,0 +1,319 @@
+"""
+Optional local HTTP service for processing award files.
+
+Runs on the standard library only, so staff can share one warm instance
+instead of each paying the pandas/openpyxl start-up cost on their laptops.
+
+Endpoints:
+- POST /process  Upload an XLSX as the raw request body. Query parameters:
+                 filename=Year 7.xlsx (used to infer the year)
+                 year=7               (overrides the filename)
+                 format=xlsx|json     (default xlsx)
+- GET  /status   JSON summary of the worker pool and request counters
+
+Run with:  python -m awards.server --port 8765 --workers 2
+"""
+import argparse
+import io
+import json
+import tempfile
+import threading
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, quote, urlparse
+
+from .constants import YEAR_RANGE
+from .pipeline import infer_year_from_filename
+
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+MAX_UPLOAD_BYTES = 20 * 1024 * 1024
+
+class WorkerCrashed(RuntimeError):
+    # Raised when a worker process died mid-job and the pool had to be rebuilt
+    pass
+
+def clean_filename(name: str) -> str:
+    """
+    Reduces an uploaded filename to a safe base name:
+    - Drops any directory part
+    - Removes control characters (incl. CR/LF), quotes and backslashes
+    Falls back to 'upload.xlsx' if nothing usable is left.
+    """
+    name = "".join(ch for ch in str(name)
+                   if not unicodedata.category(ch).startswith("C") and ch not in '"\\')
+    name = Path(name).name.strip()
+    if name in ("", ".", ".."):
+        return "upload.xlsx"
+    return name
+
+def content_disposition(filename: str) -> str:
+    """
+    Builds an attachment header with an ASCII fallback and an RFC 5987 UTF-8 filename.
+    """
+    fallback = filename.encode("ascii", "replace").decode("ascii").replace("?", "_")
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+def _warm_worker():
+    # Runs once in each worker process so heavy imports happen before the first request
+    import pandas  # noqa: F401
+    import openpyxl  # noqa: F401
+    from . import pipeline  # noqa: F401
+
+def _ping():
+    # No-op task used to force the pool to start its workers
+    return True
+
+def _process_upload(filename: str, data: bytes, year: int, fmt: str):
+    """
+    Runs in a worker process: writes the upload to a temp file and processes it.
+    Returns workbook bytes for 'xlsx', or a JSON-serialisable dict for 'json'.
+    """
+    from .pipeline import build_awards, write_awards, award_summary
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / filename
+        src.write_bytes(data)
+        out, subj_df = build_awards(src, year)
+
+    if fmt == "json":
+        return {
+            "file": filename,
+            "year": year,
+            "students": int(len(out)),
+            "summary": award_summary(out),
+            "awards": json.loads(out.to_json(orient="records")),
+            "subject_averages": json.loads(subj_df.to_json(orient="records")),
+        }
+    buf = io.BytesIO()
+    write_awards(out, subj_df, buf)
+    return buf.getvalue()
+
+class AwardsService:
+    """
+    Owns the pre-warmed worker pool and enforces concurrency and queue limits.
+    """
+
+    def __init__(self, workers: int = 2, max_queue: int = 8, timeout: float = 120.0):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker)
+        self._slots = threading.BoundedSemaphore(workers)
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.stats = {"active": 0, "queued": 0, "processed": 0, "failed": 0, "rejected": 0,
+                      "timed_out_running": 0, "pool_restarts": 0}
+
+    def warm_up(self, pool=None):
+        # Start every worker now rather than on the first upload
+        pool = pool or self.pool
+        for f in [pool.submit(_ping) for _ in range(self.workers)]:
+            f.result()
+
+    def _restart_pool(self, broken):
+        # Replace a broken pool with a fresh, pre-warmed one (once, however many requests saw it break)
+        with self._lock:
+            if self.pool is not broken:
+                return
+            pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker)
+            self.warm_up(pool)
+            self.pool = pool
+            self.stats["pool_restarts"] += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def _release_stalled(self, _future):
+        # A timed-out job has finally finished, so its worker slot is free again
+        self._bump("timed_out_running", -1)
+        self._slots.release()
+
+    def _bump(self, key: str, delta: int = 1):
+        with self._lock:
+            self.stats[key] += delta
+
+    def status(self) -> dict:
+        with self._lock:
+            stats = dict(self.stats)
+        stats.update(workers=self.workers, max_queue=self.max_queue,
+                     uptime_s=round(time.time() - self.started, 1))
+        return stats
+
+    def run(self, filename: str, data: bytes, year: int, fmt: str):
+        """
+        Queues a job and waits for a worker slot.
+        Returns (result, queue_ms, process_ms).
+        Raises OverflowError when the queue is full, TimeoutError on timeout and
+        WorkerCrashed when a worker died (the pool is rebuilt before raising).
+        """
+        with self._lock:
+            if self.stats["queued"] >= self.max_queue:
+                self.stats["rejected"] += 1
+                raise OverflowError("Server busy, try again shortly")
+            self.stats["queued"] += 1
+
+        t0 = time.perf_counter()
+        acquired = self._slots.acquire(timeout=self.timeout)
+        self._bump("queued", -1)
+        if not acquired:
+            self._bump("failed")
+            raise TimeoutError("Timed out waiting for a free worker")
+        t1 = time.perf_counter()
+        self._bump("active")
+        pool = self.pool
+        release_slot = True
+        try:
+            try:
+                future = pool.submit(_process_upload, filename, data, year, fmt)
+                result = future.result(timeout=self.timeout)
+            except FutureTimeout:
+                # A running job cannot be cancelled; keep its slot until it really finishes
+                if not future.cancel():
+                    release_slot = False
+                    self._bump("timed_out_running")
+                    future.add_done_callback(self._release_stalled)
+                raise TimeoutError("Processing timed out")
+            except BrokenProcessPool:
+                self._restart_pool(pool)
+                raise WorkerCrashed("A worker process stopped unexpectedly, try again")
+            self._bump("processed")
+            return result, (t1 - t0) * 1000, (time.perf_counter() - t1) * 1000
+        except Exception:
+            self._bump("failed")
+            raise
+        finally:
+            self._bump("active", -1)
+            if release_slot:
+                self._slots.release()
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+class AwardsHandler(BaseHTTPRequestHandler):
+    # The service instance is attached to the server in make_server()
+    server_version = "MBBCAwards/1.0"
+
+    def log_message(self, format, *args):
+        log_cb = getattr(self.server, "log_cb", None)
+        if log_cb:
+            log_cb(f"[HTTP] {self.address_string()} {format % args}")
+
+    def _send(self, code: int, body: bytes, content_type: str, headers: dict | None = None):
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, code: int, payload, headers: dict | None = None):
+        self._send(code, json.dumps(payload).encode("utf-8"), "application/json", headers)
+
+    def do_GET(self):
+        if urlparse(self.path).path != "/status":
+            self._send_json(404, {"error": "Not found"})
+            return
+        self._send_json(200, self.server.service.status())
+
+    def do_POST(self):
+        t_start = time.perf_counter()
+        url = urlparse(self.path)
+        if url.path != "/process":
+            self._send_json(404, {"error": "Not found"})
+            return
+        qs = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        # Validate the request before queueing any work
+        fmt = qs.get("format", "xlsx").lower()
+        if fmt not in ("xlsx", "json"):
+            self._send_json(400, {"error": "format must be 'xlsx' or 'json'"})
+            return
+        filename = clean_filename(qs.get("filename") or self.headers.get("X-Filename") or "")
+        try:
+            year = int(qs["year"]) if "year" in qs else infer_year_from_filename(Path(filename))
+        except ValueError:
+            year = None
+        if year is None:
+            self._send_json(400, {"error": f"{filename}: could not infer year, pass ?year="})
+            return
+        if year not in YEAR_RANGE:
+            self._send_json(400, {"error": f"{filename}: year {year} not in 7–10"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._send_json(400, {"error": "Invalid Content-Length"})
+            return
+        if length == 0:
+            self._send_json(400, {"error": "Empty upload"})
+            return
+        if length > MAX_UPLOAD_BYTES:
+            self._send_json(413, {"error": "Upload too large"})
+            return
+        data = self.rfile.read(length)
+
+        try:
+            result, queue_ms, process_ms = self.server.service.run(filename, data, year, fmt)
+        except (OverflowError, WorkerCrashed) as e:
+            self._send_json(503, {"error": str(e)}, {"Retry-After": "5"})
+            return
+        except TimeoutError as e:
+            self._send_json(504, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send_json(422, {"error": f"{filename}: {e}"})
+            return
+
+        total_ms = (time.perf_counter() - t_start) * 1000
+        timing = {
+            "X-Queue-Time-Ms": f"{queue_ms:.1f}",
+            "X-Process-Time-Ms": f"{process_ms:.1f}",
+            "X-Total-Time-Ms": f"{total_ms:.1f}",
+            "Server-Timing": f"queue;dur={queue_ms:.1f}, process;dur={process_ms:.1f}, total;dur={total_ms:.1f}",
+        }
+        if fmt == "json":
+            self._send_json(200, result, timing)
+        else:
+            timing["Content-Disposition"] = content_disposition(f"{Path(filename).stem} - Awards.xlsx")
+            self._send(200, result, XLSX_MIME, timing)
+
+def make_server(host: str = "127.0.0.1", port: int = 8765, workers: int = 2,
+                max_queue: int = 8, timeout: float = 120.0, log_cb=print) -> ThreadingHTTPServer:
+    """
+    Creates the HTTP server with a pre-warmed worker pool attached as `server.service`.
+    """
+    service = AwardsService(workers=workers, max_queue=max_queue, timeout=timeout)
+    service.warm_up()
+    httpd = ThreadingHTTPServer((host, port), AwardsHandler)
+    httpd.daemon_threads = True
+    httpd.service = service
+    httpd.log_cb = log_cb
+    return httpd
+
+def main(argv=None):
+    # Entry point: parse options and serve until interrupted
+    ap = argparse.ArgumentParser(description="MBBC Awards processing service")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--workers", type=int, default=2)
+    ap.add_argument("--max-queue", type=int, default=8)
+    ap.add_argument("--timeout", type=float, default=120.0)
+    args = ap.parse_args(argv)
+
+    httpd = make_server(args.host, args.port, args.workers, args.max_queue, args.timeout)
+    print(f"Serving on http://{args.host}:{httpd.server_address[1]} with {args.workers} worker(s)")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        httpd.service.shutdown()
+
+if __name__ == "__main__":
+    main()
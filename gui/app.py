@@ -4,7 +4,10 @@ from pathlib import Path
 import pandas as pd
 import sys
 
-from awards.pipeline import process_file
+from awards.constants import YEAR_RANGE
+from awards.pipeline import (process_file, infer_year_from_filename, build_awards,
+                             write_awards, award_summary)
+from gui.preview import PreviewPane
 
 class App(tk.Tk):
     def __init__(self):
@@ -29,6 +32,8 @@ class App(tk.Tk):
             print(f"Icon load failed: {e}")
         self.files = []           # List of selected Excel files
         self.out_dir = Path.cwd() # Output directory for processed files
+        self.preview_src = None   # File currently shown in the preview pane
+        self.preview_data = None  # In-memory (awards, subject averages) for preview_src
         self._build()             # Build the GUI
 
     def _build(self):
@@ -56,8 +61,16 @@ class App(tk.Tk):
         # Run frame: process and quit buttons
         frm_run = ttk.Frame(self, padding=8); frm_run.pack(fill=tk.X)
         ttk.Button(frm_run, text="Process", command=self.process_all).pack(side=tk.LEFT)
+        ttk.Button(frm_run, text="Preview", command=self.preview_selected).pack(side=tk.LEFT, padx=4)
+        self.btn_save = ttk.Button(frm_run, text="Save preview…", command=self.save_preview,
+                                   state=tk.DISABLED)
+        self.btn_save.pack(side=tk.LEFT)
         ttk.Button(frm_run, text="Quit", command=self.destroy).pack(side=tk.RIGHT)
 
+        # Preview frame: processed awards shown from memory, nothing written to disk
+        frm_prev = ttk.LabelFrame(self, text="Preview", padding=8); frm_prev.pack(fill=tk.BOTH, expand=True, padx=8)
+        self.preview = PreviewPane(frm_prev); self.preview.pack(fill=tk.BOTH, expand=True)
+
         # Log frame: shows log messages in a text box
         frm_log = ttk.Frame(self, padding=8); frm_log.pack(fill=tk.BOTH, expand=True)
         ttk.Label(frm_log, text="Log:").pack(anchor=tk.W)
@@ -90,13 +103,15 @@ class App(tk.Tk):
         # Remove selected files from the list and internal storage
         sel = list(self.lst.curselection()); sel.reverse()
         for idx in sel:
-            self.files.pop(idx)
+            if self.files.pop(idx) == self.preview_src:
+                self._clear_preview()
             self.lst.delete(idx)
 
     def clear_files(self):
         # Clear all files from the list and internal storage
         self.files.clear()
         self.lst.delete(0, tk.END)
+        self._clear_preview()
 
     def choose_out_dir(self):
         # Open folder dialog to select output directory
@@ -118,6 +133,51 @@ class App(tk.Tk):
                 ok += 1
         messagebox.showinfo("Done", f"Processed {ok} file(s).")
 
+    def preview_selected(self):
+        # Process the selected (or first) file in memory and show it in the preview pane
+        if not self.files:
+            messagebox.showwarning("No files", "Add at least one .xlsx file.")
+            return
+        sel = self.lst.curselection()
+        p = Path(self.files[sel[0] if sel else 0])
+        year = infer_year_from_filename(p)
+        if year is None:
+            self.log(f"[SKIP] {p.name}: could not infer year from filename")
+            return
+        if year not in YEAR_RANGE:
+            self.log(f"[SKIP] {p.name}: year {year} not in 7–10")
+            return
+        pd.options.mode.copy_on_write = False
+        try:
+            out, subj_df = build_awards(p, year)
+        except Exception as e:
+            self.log(f"[ERR]  {p.name}: {e}")
+            return
+        self.preview_src, self.preview_data = p, (out, subj_df)
+        self.preview.show(out, award_summary(out))
+        self.btn_save.config(state=tk.NORMAL)
+        self.log(f"[VIEW] {p.name}: {len(out)} students")
+
+    def save_preview(self):
+        # Write the previewed awards to disk once the user confirms
+        if self.preview_data is None:
+            return
+        out_path = self.out_dir / f"{self.preview_src.stem} - Awards.xlsx"
+        if not messagebox.askyesno("Save awards", f"Write {out_path}?"):
+            return
+        try:
+            write_awards(*self.preview_data, out_path)
+        except Exception as e:
+            self.log(f"[ERR]  {self.preview_src.name}: {e}")
+            return
+        self.log(f"[OK]   {self.preview_src.name} → {out_path.name}")
+
+    def _clear_preview(self):
+        # Drop any in-memory preview
+        self.preview_src = self.preview_data = None
+        self.preview.clear()
+        self.btn_save.config(state=tk.DISABLED)
+
 def main():
     # Entry point: create and run the application
     app = App()
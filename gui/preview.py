@@ -0,0 +1,126 @@
+import tkinter as tk
+from tkinter import ttk
+import pandas as pd
+
+PAGE_SIZE = 200          # Rows rendered in the Treeview at once
+ALL_AWARDS = "All"       # Filter value that shows every student
+NO_AWARD = "(no award)"  # Filter value for students without an award
+
+def filter_sort(df: pd.DataFrame, award: str = ALL_AWARDS, sort_col=None, ascending=True) -> pd.DataFrame:
+    """
+    Returns the rows of df matching the award filter, sorted by sort_col.
+    Missing values always sort last.
+    """
+    view = df
+    if award != ALL_AWARDS and "Award" in df:
+        target = "" if award == NO_AWARD else award
+        view = df[df["Award"].fillna("").astype(str) == target]
+    if sort_col in view:
+        view = view.sort_values(sort_col, ascending=ascending, na_position="last", kind="stable")
+    return view
+
+def page_count(n_rows: int, page_size: int = PAGE_SIZE) -> int:
+    # Number of pages needed to show n_rows, at least one
+    return max(1, -(-n_rows // page_size))
+
+def _fmt(val) -> str:
+    # Formats a cell value for display
+    if pd.isna(val):
+        return ""
+    if isinstance(val, float):
+        return f"{val:.2f}".rstrip("0").rstrip(".")
+    return str(val)
+
+class PreviewPane(ttk.Frame):
+    """
+    Shows processed awards straight from in-memory DataFrames.
+    Only one page of rows is inserted into the Treeview at a time, so large
+    tables render instantly. Click a heading to sort, pick an award to filter.
+    """
+
+    def __init__(self, master, **kw):
+        super().__init__(master, **kw)
+        self.df = pd.DataFrame()   # Full awards table being previewed
+        self.view = self.df        # Filtered and sorted rows
+        self.page = 0
+        self.sort_col = None
+        self.ascending = True
+        self._build()
+
+    def _build(self):
+        # Controls: award filter, paging and summary
+        frm_ctl = ttk.Frame(self); frm_ctl.pack(fill=tk.X)
+        ttk.Label(frm_ctl, text="Award:").pack(side=tk.LEFT)
+        self.award_var = tk.StringVar(value=ALL_AWARDS)
+        self.cmb_award = ttk.Combobox(frm_ctl, textvariable=self.award_var, state="readonly",
+                                      values=[ALL_AWARDS], width=28)
+        self.cmb_award.pack(side=tk.LEFT, padx=4)
+        self.cmb_award.bind("<<ComboboxSelected>>", lambda e: self._refresh())
+        ttk.Button(frm_ctl, text="Next ›", command=lambda: self._goto(self.page + 1)).pack(side=tk.RIGHT)
+        self.lbl_page = ttk.Label(frm_ctl); self.lbl_page.pack(side=tk.RIGHT, padx=4)
+        ttk.Button(frm_ctl, text="‹ Prev", command=lambda: self._goto(self.page - 1)).pack(side=tk.RIGHT)
+        self.lbl_summary = ttk.Label(self, anchor=tk.W); self.lbl_summary.pack(fill=tk.X, pady=(4, 0))
+
+        # Table: Treeview with scrollbars
+        frm_tbl = ttk.Frame(self); frm_tbl.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(frm_tbl, show="headings", height=12)
+        sby = ttk.Scrollbar(frm_tbl, orient=tk.VERTICAL, command=self.tree.yview)
+        sbx = ttk.Scrollbar(frm_tbl, orient=tk.HORIZONTAL, command=self.tree.xview)
+        self.tree.configure(yscrollcommand=sby.set, xscrollcommand=sbx.set)
+        sby.pack(side=tk.RIGHT, fill=tk.Y); sbx.pack(side=tk.BOTTOM, fill=tk.X)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    def show(self, df: pd.DataFrame, summary: dict):
+        # Load a new awards table and its award-count summary
+        self.df = df.reset_index(drop=True)
+        self.sort_col, self.ascending = None, True
+        awards = sorted(a for a in summary)
+        self.cmb_award.configure(values=[ALL_AWARDS] + awards + [NO_AWARD])
+        self.award_var.set(ALL_AWARDS)
+        parts = [f"{a}: {n}" for a, n in summary.items()]
+        self.lbl_summary.config(text=f"{len(self.df)} students — " + (", ".join(parts) or "no awards"))
+
+        cols = [str(c) for c in self.df.columns]
+        self.tree.configure(columns=cols)
+        for c in cols:
+            self.tree.heading(c, text=c, command=lambda c=c: self._sort_by(c))
+            width = 180 if c.lower().startswith("student_name") or c == "Award" else 80
+            self.tree.column(c, width=width, stretch=False, anchor=tk.CENTER)
+        self._refresh()
+
+    def clear(self):
+        # Remove any previewed table
+        self.tree.delete(*self.tree.get_children())
+        self.tree.configure(columns=[])
+        self.df = self.view = pd.DataFrame()
+        self.lbl_summary.config(text="")
+        self.lbl_page.config(text="")
+
+    def _sort_by(self, col: str):
+        # Clicking the same heading again reverses the order
+        if self.sort_col == col:
+            self.ascending = not self.ascending
+        else:
+            self.sort_col, self.ascending = col, True
+        self._refresh()
+
+    def _refresh(self):
+        # Reapply filter and sort, then show the first page
+        self.view = filter_sort(self.df, self.award_var.get(), self.sort_col, self.ascending)
+        for c in self.tree["columns"]:
+            arrow = ""
+            if c == self.sort_col:
+                arrow = " ▲" if self.ascending else " ▼"
+            self.tree.heading(c, text=c + arrow)
+        self._goto(0)
+
+    def _goto(self, page: int):
+        # Render a single page of rows into the Treeview
+        pages = page_count(len(self.view))
+        self.page = min(max(page, 0), pages - 1)
+        start = self.page * PAGE_SIZE
+        chunk = self.view.iloc[start:start + PAGE_SIZE]
+        self.tree.delete(*self.tree.get_children())
+        for row in chunk.itertuples(index=False, name=None):
+            self.tree.insert("", tk.END, values=[_fmt(v) for v in row])
+        self.lbl_page.config(text=f"Page {self.page + 1}/{pages} ({len(self.view)} rows)")
@@ -0,0 +1,34 @@
+# tests/test_preview.py
+import numpy as np
+import pandas as pd
+
+from gui.preview import ALL_AWARDS, NO_AWARD, filter_sort, page_count
+
+
+def _awards_df():
+    return pd.DataFrame({
+        "Student_Name": ["Alpha", "Beta", "Gamma", "Delta"],
+        "Award": ["Academic Award", "", "Special Merit Award", "Academic Award"],
+        "Grade Point": [88.0, 70.0, 93.5, np.nan],
+    })
+
+
+def test_filter_by_award():
+    df = _awards_df()
+    assert len(filter_sort(df, ALL_AWARDS)) == 4
+    assert list(filter_sort(df, "Academic Award")["Student_Name"]) == ["Alpha", "Delta"]
+    assert list(filter_sort(df, NO_AWARD)["Student_Name"]) == ["Beta"]
+
+
+def test_sort_puts_missing_last():
+    df = _awards_df()
+    desc = filter_sort(df, ALL_AWARDS, "Grade Point", ascending=False)
+    assert list(desc["Student_Name"]) == ["Gamma", "Alpha", "Beta", "Delta"]
+    asc = filter_sort(df, "Academic Award", "Grade Point", ascending=True)
+    assert list(asc["Student_Name"]) == ["Alpha", "Delta"]
+
+
+def test_page_count():
+    assert page_count(0, 200) == 1
+    assert page_count(200, 200) == 1
+    assert page_count(201, 200) == 2
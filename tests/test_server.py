@@ -0,0 +1,107 @@
+# tests/test_server.py
+import http.client
+import json
+import os
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import pytest
+
+from awards.server import make_server
+
+
+@pytest.fixture(scope="module")
+def httpd():
+    httpd = make_server(port=0, workers=1, log_cb=None)
+    t = threading.Thread(target=httpd.serve_forever, daemon=True)
+    t.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    httpd.service.shutdown()
+
+
+@pytest.fixture(scope="module")
+def server_url(httpd):
+    return f"http://127.0.0.1:{httpd.server_address[1]}"
+
+
+def _post(url, data, **params):
+    req = urllib.request.Request(f"{url}/process?{urllib.parse.urlencode(params)}",
+                                 data=data, method="POST")
+    return urllib.request.urlopen(req, timeout=60)
+
+
+def test_status(server_url):
+    with urllib.request.urlopen(f"{server_url}/status", timeout=10) as resp:
+        body = json.loads(resp.read())
+    assert body["workers"] == 1
+    assert body["active"] == 0
+
+
+def test_process_json(server_url, sample_files):
+    data = sample_files["Year 7.xlsx"].read_bytes()
+    with _post(server_url, data, filename="Year 7.xlsx", format="json") as resp:
+        assert "X-Process-Time-Ms" in resp.headers
+        body = json.loads(resp.read())
+    assert body["year"] == 7
+    assert body["students"] == len(body["awards"])
+    assert sum(body["summary"].values()) <= body["students"]
+
+
+def test_process_xlsx(server_url, sample_files):
+    data = sample_files["Year 10.xlsx"].read_bytes()
+    with _post(server_url, data, filename="Year 10.xlsx") as resp:
+        assert resp.headers["Content-Type"].endswith("spreadsheetml.sheet")
+        assert resp.read()[:2] == b"PK"
+
+
+def test_process_rejects_unknown_year(server_url):
+    with pytest.raises(urllib.error.HTTPError) as e:
+        _post(server_url, b"x", filename="Results.xlsx")
+    assert e.value.code == 400
+
+
+def test_process_xlsx_non_ascii_filename(server_url, sample_files):
+    data = sample_files["Year 7.xlsx"].read_bytes()
+    with _post(server_url, data, filename="Year 7 – Semester 1.xlsx") as resp:
+        disp = resp.headers["Content-Disposition"]
+        assert 'filename="Year 7 _ Semester 1 - Awards.xlsx"' in disp
+        assert "filename*=UTF-8''Year%207%20%E2%80%93%20Semester%201%20-%20Awards.xlsx" in disp
+        assert resp.read()[:2] == b"PK"
+
+
+def test_process_strips_header_injection(server_url, sample_files):
+    data = sample_files["Year 7.xlsx"].read_bytes()
+    with _post(server_url, data, filename='Year 7\r\nSet-Cookie: x="1".xlsx') as resp:
+        assert resp.headers.get("Set-Cookie") is None
+        assert "\n" not in resp.headers["Content-Disposition"]
+
+
+@pytest.mark.parametrize("length", ["abc", "-5"])
+def test_process_rejects_invalid_content_length(httpd, length):
+    conn = http.client.HTTPConnection("127.0.0.1", httpd.server_address[1], timeout=10)
+    conn.putrequest("POST", "/process?filename=Year%207.xlsx")
+    conn.putheader("Content-Length", length)
+    conn.endheaders()
+    resp = conn.getresponse()
+    assert resp.status == 400
+    assert json.loads(resp.read())["error"] == "Invalid Content-Length"
+    conn.close()
+
+
+def test_pool_recovers_after_worker_dies(httpd, server_url, sample_files):
+    # Kill the only worker, as an OOM or segfault would
+    try:
+        httpd.service.pool.submit(os._exit, 1).result(timeout=10)
+    except Exception:
+        pass
+    data = sample_files["Year 7.xlsx"].read_bytes()
+    with pytest.raises(urllib.error.HTTPError) as e:
+        _post(server_url, data, filename="Year 7.xlsx", format="json")
+    assert e.value.code == 503
+    assert httpd.service.status()["pool_restarts"] == 1
+    with _post(server_url, data, filename="Year 7.xlsx", format="json") as resp:
+        assert json.loads(resp.read())["year"] == 7